@@ -24,6 +24,7 @@ class Settings(BaseSettings):
     # Redis settings
     redis_url: str = "redis://redis:6379/0"
     redis_enabled: bool = True
+    redis_pool_size: int = 64
 
     # API settings
     api_host: str = "0.0.0.0"
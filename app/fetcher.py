@@ -1,17 +1,45 @@
 """
 Fetcher service with Redis caching and deduplication logic.
 """
-import json
+import asyncio
 import logging
-from datetime import datetime, date
-from typing import List, Optional, Tuple
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime, date, timezone
+from typing import Dict, List, Optional, Tuple, Union
 
+import orjson
 import redis.asyncio as redis
+import zstandard
+from pydantic import TypeAdapter
 from app.models import VideoData, get_category_id_by_name
 from app.youtube_client import YouTubeClient, YouTubeAPIError
 
 logger = logging.getLogger(__name__)
 
+# Validates/serializes whole video lists in a single pydantic-core pass.
+# Reads parse JSON with orjson first: validate_python on the decoded list
+# is about twice as fast as validate_json on the raw payload.
+_VIDEO_LIST_ADAPTER = TypeAdapter(List[VideoData])
+
+# Cached payloads are zstd-compressed; plain JSON entries are still readable
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+# [refreshed_at, iso_date] for _today_iso()
+_DATE_CACHE: list = [float("-inf"), ""]
+
+
+def _today_iso() -> str:
+    """Return today's date as YYYY-MM-DD, recomputed at most once per second."""
+    now = time.monotonic()
+    if now - _DATE_CACHE[0] >= 1.0:
+        _DATE_CACHE[0] = now
+        _DATE_CACHE[1] = date.today().isoformat()
+    return _DATE_CACHE[1]
+
 
 class FetcherService:
     """
@@ -19,6 +47,7 @@ class FetcherService:
 
     Features:
     - Redis caching with TTL
+    - In-process LRU cache in front of Redis for hot keys
     - Deduplication by videoId + date
     - Fallback to cache during API failures
     - Multiple fetch strategies (trending, search, channel)
@@ -27,6 +56,8 @@ class FetcherService:
     CACHE_TTL = 3600 * 24  # 24 hours
     CACHE_KEY_PREFIX = "trending"
     LAST_FETCH_KEY = "last_fetch_timestamp"
+    MEMORY_CACHE_SIZE = 64
+    MEMORY_CACHE_TTL = 60  # seconds
 
     def __init__(
         self,
@@ -43,6 +74,8 @@ class FetcherService:
         self.youtube_client = youtube_client
         self.redis_client = redis_client
         self.cache_enabled = redis_client is not None
+        # cache_key -> (expires_at, videos), least recently used first
+        self._memory_cache: "OrderedDict[str, Tuple[float, List[VideoData]]]" = OrderedDict()
 
         if not self.cache_enabled:
             logger.warning("Redis client not provided. Caching is disabled.")
@@ -74,19 +107,61 @@ class FetcherService:
         Returns:
             Cache key string
         """
-        if not date_str:
-            date_str = date.today().isoformat()
-
-        parts = [self.CACHE_KEY_PREFIX, country, date_str]
+        key = f"{self.CACHE_KEY_PREFIX}:{country}:{date_str or _today_iso()}"
 
         if category:
-            parts.append(f"cat_{category}")
+            key += f":cat_{category}"
         if keyword:
-            parts.append(f"kw_{keyword}")
+            key += f":kw_{keyword}"
         if channel_id:
-            parts.append(f"ch_{channel_id}")
+            key += f":ch_{channel_id}"
+
+        return key
+
+    def _get_from_memory(self, cache_key: str) -> Optional[List[VideoData]]:
+        """
+        Retrieve videos from the in-process cache.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            List of VideoData or None if not found or expired
+        """
+        entry = self._memory_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, videos = entry
+        if time.monotonic() >= expires_at:
+            del self._memory_cache[cache_key]
+            return None
 
-        return ":".join(parts)
+        self._memory_cache.move_to_end(cache_key)
+        return videos
+
+    def _save_to_memory(self, cache_key: str, videos: List[VideoData]) -> None:
+        """
+        Save videos to the in-process cache, evicting the least recently used key.
+
+        Args:
+            cache_key: Cache key
+            videos: List of VideoData objects
+        """
+        self._memory_cache[cache_key] = (
+            time.monotonic() + self.MEMORY_CACHE_TTL,
+            videos
+        )
+        self._memory_cache.move_to_end(cache_key)
+        if len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+
+    @staticmethod
+    def _decode_cached_videos(cached_data: Union[str, bytes]) -> List[VideoData]:
+        """Decode a cached payload (zstd-compressed or plain JSON) into videos."""
+        if isinstance(cached_data, bytes) and cached_data[:4] == _ZSTD_MAGIC:
+            cached_data = _ZSTD_DECOMPRESSOR.decompress(cached_data)
+        return _VIDEO_LIST_ADAPTER.validate_python(orjson.loads(cached_data))
 
     async def _get_from_cache(self, cache_key: str) -> Optional[List[VideoData]]:
         """
@@ -101,64 +176,141 @@ class FetcherService:
         if not self.cache_enabled:
             return None
 
+        videos = self._get_from_memory(cache_key)
+        if videos is not None:
+            logger.info("Memory cache hit: %s", cache_key)
+            return videos
+
         try:
             cached_data = await self.redis_client.get(cache_key)
             if cached_data:
-                logger.info(f"Cache hit: {cache_key}")
-                videos_dict = json.loads(cached_data)
-                return [VideoData(**v) for v in videos_dict]
+                logger.info("Cache hit: %s", cache_key)
+                videos = self._decode_cached_videos(cached_data)
+                self._save_to_memory(cache_key, videos)
+                return videos
             else:
-                logger.info(f"Cache miss: {cache_key}")
+                logger.info("Cache miss: %s", cache_key)
                 return None
 
         except Exception as e:
-            logger.error(f"Failed to retrieve from cache: {str(e)}")
+            logger.error("Failed to retrieve from cache: %s", e)
             return None
 
     async def _save_to_cache(
         self,
         cache_key: str,
-        videos: List[VideoData]
-    ) -> None:
+        videos: List[VideoData],
+        pipe: Optional[redis.client.Pipeline] = None
+    ) -> bool:
         """
         Save videos to cache with TTL.
 
+        With a pipeline the write is only queued; the caller fills the
+        memory cache once the pipeline has executed.
+
         Args:
             cache_key: Cache key
             videos: List of VideoData objects
+            pipe: Redis pipeline to queue the write on (optional)
+
+        Returns:
+            True if the write was sent, or queued on the pipeline
         """
         if not self.cache_enabled:
-            return
+            return False
 
         try:
-            videos_dict = [v.model_dump(by_alias=True) for v in videos]
-            # Convert datetime to ISO string for JSON serialization
-            for video in videos_dict:
-                if isinstance(video.get("publishedAt"), datetime):
-                    video["publishedAt"] = video["publishedAt"].isoformat()
-
-            await self.redis_client.setex(
-                cache_key,
-                self.CACHE_TTL,
-                json.dumps(videos_dict, default=str)
+            payload = _ZSTD_COMPRESSOR.compress(
+                _VIDEO_LIST_ADAPTER.dump_json(videos, by_alias=True)
             )
-            logger.info(f"Cached {len(videos)} videos: {cache_key}")
+
+            if pipe is not None:
+                # Queued; sent when the caller executes the pipeline
+                pipe.setex(cache_key, self.CACHE_TTL, payload)
+                return True
+
+            await self.redis_client.setex(cache_key, self.CACHE_TTL, payload)
+            self._save_to_memory(cache_key, videos)
+            logger.info("Cached %s videos: %s", len(videos), cache_key)
+            return True
 
         except Exception as e:
-            logger.error(f"Failed to save to cache: {str(e)}")
+            logger.error("Failed to save to cache: %s", e)
+            return False
 
-    async def _update_last_fetch_timestamp(self) -> None:
-        """Update the last successful fetch timestamp."""
+    async def _update_last_fetch_timestamp(
+        self,
+        pipe: Optional[redis.client.Pipeline] = None
+    ) -> None:
+        """
+        Update the last successful fetch timestamp.
+
+        Args:
+            pipe: Redis pipeline to queue the write on (optional)
+        """
         if not self.cache_enabled:
             return
 
         try:
-            await self.redis_client.set(
-                self.LAST_FETCH_KEY,
-                datetime.utcnow().isoformat()
-            )
+            # Stored as epoch nanoseconds; converted to datetime only on read
+            if pipe is not None:
+                pipe.set(self.LAST_FETCH_KEY, time.time_ns())
+            else:
+                await self.redis_client.set(self.LAST_FETCH_KEY, time.time_ns())
         except Exception as e:
-            logger.error(f"Failed to update last fetch timestamp: {str(e)}")
+            logger.error("Failed to update last fetch timestamp: %s", e)
+
+    async def _save_fetch_results(
+        self,
+        entries: List[Tuple[str, List[VideoData]]]
+    ) -> bool:
+        """
+        Cache fetched videos and bump the last fetch timestamp in one round-trip.
+
+        Args:
+            entries: List of (cache key, videos) pairs
+
+        Returns:
+            True if the pipeline was flushed successfully
+        """
+        if not self.cache_enabled:
+            return False
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                queued = [
+                    (cache_key, videos)
+                    for cache_key, videos in entries
+                    if await self._save_to_cache(cache_key, videos, pipe=pipe)
+                ]
+                await self._update_last_fetch_timestamp(pipe=pipe)
+                await pipe.execute()
+
+        except Exception as e:
+            logger.error("Failed to save fetch results to cache: %s", e)
+            return False
+
+        # Only now has the data reached Redis
+        for cache_key, videos in queued:
+            self._save_to_memory(cache_key, videos)
+            logger.info("Cached %s videos: %s", len(videos), cache_key)
+        return True
+
+    @staticmethod
+    def _parse_last_fetch_timestamp(
+        timestamp: Optional[Union[str, bytes]]
+    ) -> Optional[datetime]:
+        """Convert a stored last fetch value into a datetime."""
+        if not timestamp:
+            return None
+
+        if isinstance(timestamp, bytes):
+            timestamp = timestamp.decode()
+        if timestamp.isdigit():
+            return datetime.fromtimestamp(int(timestamp) / 1e9, tz=timezone.utc)
+
+        # Values written before the switch to epoch nanoseconds
+        return datetime.fromisoformat(timestamp)
 
     async def get_last_fetch_timestamp(self) -> Optional[datetime]:
         """Get the last successful fetch timestamp."""
@@ -166,12 +318,10 @@ class FetcherService:
             return None
 
         try:
-            timestamp_str = await self.redis_client.get(self.LAST_FETCH_KEY)
-            if timestamp_str:
-                return datetime.fromisoformat(timestamp_str.decode())
-            return None
+            timestamp = await self.redis_client.get(self.LAST_FETCH_KEY)
+            return self._parse_last_fetch_timestamp(timestamp)
         except Exception as e:
-            logger.error(f"Failed to get last fetch timestamp: {str(e)}")
+            logger.error("Failed to get last fetch timestamp: %s", e)
             return None
 
     async def fetch_trending(
@@ -199,6 +349,9 @@ class FetcherService:
         Returns:
             Tuple of (videos list, from_cache boolean)
         """
+        # Country codes repeat on every request; intern to reuse one object
+        country = sys.intern(country.upper())
+
         # Build cache key
         cache_key = self._build_cache_key(
             country, category, keyword, channel_id, date_str
@@ -210,60 +363,20 @@ class FetcherService:
             if cached_videos:
                 return cached_videos[:limit], True
 
-        # Determine fetch strategy
-        videos = []
-        category_id = None
-
         try:
-            # Priority 1: Channel-specific videos
-            if channel_id:
-                logger.info(f"Fetching videos from channel: {channel_id}")
-                videos = await self.youtube_client.get_channel_videos(
-                    channel_id=channel_id,
-                    max_results=limit
-                )
-
-            # Priority 2: Keyword search
-            elif keyword:
-                logger.info(f"Searching videos by keyword: {keyword}")
-                videos = await self.youtube_client.search_videos(
-                    query=keyword,
-                    region_code=country,
-                    max_results=limit
-                )
-
-            # Priority 3: Trending by category
-            else:
-                if category:
-                    # Try to resolve category name to ID
-                    category_id = get_category_id_by_name(category)
-                    if not category_id:
-                        # Assume it's already an ID
-                        category_id = category
-
-                logger.info(
-                    f"Fetching trending videos: country={country}, "
-                    f"category_id={category_id or 'all'}"
-                )
-                videos = await self.youtube_client.get_trending_videos(
-                    region_code=country,
-                    category_id=category_id,
-                    max_results=limit
-                )
-
-            # Apply keyword filter if both trending and keyword are specified
-            if keyword and not channel_id and videos:
-                videos = self._filter_by_keyword(videos, keyword)
+            videos = await self._fetch_from_youtube(
+                country, category, keyword, channel_id, limit,
+                use_memo=not force_refresh
+            )
 
             # Save to cache
             if videos:
-                await self._save_to_cache(cache_key, videos)
-                await self._update_last_fetch_timestamp()
+                await self._save_fetch_results([(cache_key, videos)])
 
             return videos[:limit], False
 
         except YouTubeAPIError as e:
-            logger.error(f"YouTube API error, trying cache fallback: {str(e)}")
+            logger.error("YouTube API error, trying cache fallback: %s", e)
 
             # Fallback to cache
             cached_videos = await self._get_from_cache(cache_key)
@@ -274,6 +387,169 @@ class FetcherService:
             # No cache available, re-raise error
             raise
 
+    async def _fetch_from_youtube(
+        self,
+        country: str,
+        category: Optional[str] = None,
+        keyword: Optional[str] = None,
+        channel_id: Optional[str] = None,
+        limit: int = 10,
+        use_memo: bool = True
+    ) -> List[VideoData]:
+        """
+        Fetch videos from the YouTube API using the matching strategy.
+
+        Args:
+            country: ISO country code
+            category: Category name or ID
+            keyword: Search keyword
+            channel_id: Channel ID
+            limit: Maximum number of results
+            use_memo: Allow the client's in-process response cache
+
+        Returns:
+            List of VideoData objects
+
+        Raises:
+            YouTubeAPIError: If the YouTube API request fails
+        """
+        # Determine fetch strategy
+        videos = []
+        category_id = None
+
+        # Priority 1: Channel-specific videos
+        if channel_id:
+            logger.info("Fetching videos from channel: %s", channel_id)
+            videos = await self.youtube_client.get_channel_videos(
+                channel_id=channel_id,
+                max_results=limit,
+                use_memo=use_memo
+            )
+
+        # Priority 2: Keyword search
+        elif keyword:
+            logger.info("Searching videos by keyword: %s", keyword)
+            videos = await self.youtube_client.search_videos(
+                query=keyword,
+                region_code=country,
+                max_results=limit,
+                use_memo=use_memo
+            )
+
+        # Priority 3: Trending by category
+        else:
+            if category:
+                # Try to resolve category name to ID
+                category_id = get_category_id_by_name(category)
+                if not category_id:
+                    # Assume it's already an ID
+                    category_id = category
+
+            logger.info(
+                "Fetching trending videos: country=%s, category_id=%s",
+                country,
+                category_id or "all"
+            )
+            videos = await self.youtube_client.get_trending_videos(
+                region_code=country,
+                category_id=category_id,
+                max_results=limit,
+                use_memo=use_memo
+            )
+
+        # Apply keyword filter if both trending and keyword are specified
+        if keyword and not channel_id and videos:
+            videos = self._filter_by_keyword(videos, keyword)
+
+        return videos
+
+    async def fetch_trending_many(
+        self,
+        country: str,
+        categories: List[str],
+        limit: int = 10
+    ) -> Dict[str, Tuple[List[VideoData], bool]]:
+        """
+        Fetch trending videos for several categories at once.
+
+        Cached categories are read with a single MGET; only the misses are
+        fetched from YouTube, concurrently, and written back in one pipeline.
+
+        Args:
+            country: ISO country code
+            categories: List of category names/IDs
+            limit: Maximum number of results per category
+
+        Returns:
+            Dict of category to (videos list, from_cache boolean). Categories
+            that fail to fetch are logged and left out.
+        """
+        country = sys.intern(country.upper())
+        cache_keys = {
+            category: self._build_cache_key(country, category)
+            for category in categories
+        }
+        results: Dict[str, Tuple[List[VideoData], bool]] = {}
+
+        if self.cache_enabled:
+            pending = []
+            for category, cache_key in cache_keys.items():
+                videos = self._get_from_memory(cache_key)
+                if videos is not None:
+                    results[category] = (videos[:limit], True)
+                else:
+                    pending.append(category)
+
+            if pending:
+                try:
+                    cached = await self.redis_client.mget(
+                        [cache_keys[category] for category in pending]
+                    )
+                except Exception as e:
+                    logger.error("Failed to retrieve from cache: %s", e)
+                    cached = [None] * len(pending)
+
+                for category, cached_data in zip(pending, cached):
+                    if not cached_data:
+                        continue
+                    try:
+                        videos = self._decode_cached_videos(cached_data)
+                    except Exception as e:
+                        logger.error("Failed to decode cached videos: %s", e)
+                        continue
+                    self._save_to_memory(cache_keys[category], videos)
+                    results[category] = (videos[:limit], True)
+
+        misses = [category for category in categories if category not in results]
+        if not misses:
+            return results
+
+        logger.info("Fetching %s uncached categories for %s", len(misses), country)
+        fetched = await asyncio.gather(
+            *[
+                self._fetch_from_youtube(country=country, category=category, limit=limit)
+                for category in misses
+            ],
+            return_exceptions=True
+        )
+
+        entries = []
+        for category, result in zip(misses, fetched):
+            # BaseException: gather also returns CancelledError here
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to fetch trending videos for %s: %s", category, result
+                )
+                continue
+            results[category] = (result[:limit], False)
+            if result:
+                entries.append((cache_keys[category], result))
+
+        if entries:
+            await self._save_fetch_results(entries)
+
+        return results
+
     def _filter_by_keyword(
         self,
         videos: List[VideoData],
@@ -289,30 +565,15 @@ class FetcherService:
         Returns:
             Filtered list of videos
         """
+        # One substring scan over each video's cached, lowercased search blob
         keyword_lower = keyword.lower()
-        filtered = []
-
-        for video in videos:
-            # Check title
-            if keyword_lower in video.title.lower():
-                filtered.append(video)
-                continue
-
-            # Check description
-            if keyword_lower in video.description.lower():
-                filtered.append(video)
-                continue
-
-            # Check tags
-            if video.tags:
-                for tag in video.tags:
-                    if keyword_lower in tag.lower():
-                        filtered.append(video)
-                        break
+        filtered = [video for video in videos if keyword_lower in video.search_blob]
 
         logger.info(
-            f"Filtered {len(videos)} videos to {len(filtered)} "
-            f"matching keyword '{keyword}'"
+            "Filtered %s videos to %s matching keyword '%s'",
+            len(videos),
+            len(filtered),
+            keyword
         )
         return filtered
 
@@ -330,26 +591,43 @@ class FetcherService:
             categories: List of category names/IDs
             limit: Number of videos per category
         """
+        country = sys.intern(country.upper())
+
         logger.info(
-            f"Starting scheduled fetch for {country} - "
-            f"categories: {', '.join(categories)}"
+            "Starting scheduled fetch for %s - categories: %s",
+            country,
+            ", ".join(categories)
         )
 
-        for category in categories:
-            try:
-                await self.fetch_trending(
-                    country=country,
-                    category=category,
-                    limit=limit,
-                    force_refresh=True
+        # A refresh must hit the API, not replay the client's recent responses
+        results = await asyncio.gather(
+            *[
+                self._fetch_from_youtube(
+                    country=country, category=category, limit=limit, use_memo=False
                 )
-                logger.info(
-                    f"Successfully cached trending videos for: {category}")
+                for category in categories
+            ],
+            return_exceptions=True
+        )
 
-            except Exception as e:
+        fetched = []
+        for category, result in zip(categories, results):
+            # BaseException: gather also returns CancelledError here
+            if isinstance(result, BaseException):
                 logger.error(
-                    f"Failed to fetch trending videos for {category}: {str(e)}"
+                    "Failed to fetch trending videos for %s: %s", category, result
                 )
+            elif result:
+                fetched.append((category, result))
+
+        # Flush every category write in a single round-trip
+        entries = [
+            (self._build_cache_key(country, category), videos)
+            for category, videos in fetched
+        ]
+        if entries and await self._save_fetch_results(entries):
+            for category, _ in fetched:
+                logger.info("Successfully cached trending videos for: %s", category)
 
         logger.info("Scheduled fetch completed")
 
@@ -362,5 +640,33 @@ class FetcherService:
             await self.redis_client.ping()
             return True
         except Exception as e:
-            logger.error(f"Redis connection check failed: {str(e)}")
+            logger.error("Redis connection check failed: %s", e)
             return False
+
+    async def get_redis_health(self) -> Tuple[bool, Optional[datetime]]:
+        """
+        Check Redis connectivity and read the last fetch timestamp together.
+
+        Sends PING and the last fetch GET on one pipeline, so the health
+        endpoint needs a single round-trip.
+
+        Returns:
+            Tuple of (redis connected boolean, last fetch timestamp)
+        """
+        if not self.cache_enabled:
+            return False, None
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.ping()
+                pipe.get(self.LAST_FETCH_KEY)
+                _, timestamp = await pipe.execute()
+        except Exception as e:
+            logger.error("Redis connection check failed: %s", e)
+            return False, None
+
+        try:
+            return True, self._parse_last_fetch_timestamp(timestamp)
+        except Exception as e:
+            logger.error("Failed to get last fetch timestamp: %s", e)
+            return True, None
@@ -35,19 +35,17 @@ async def lifespan(app: FastAPI):
         logger.error("YOUTUBE_API_KEY is not set!")
         raise ValueError("YOUTUBE_API_KEY environment variable is required")
 
-    # Initialize YouTube client
-    youtube_client = YouTubeClient(api_key=settings.youtube_api_key)
-    logger.info("YouTube client initialized")
-
     # Initialize Redis client (optional)
     redis_client = None
     if settings.redis_enabled:
         try:
-            redis_client = redis.from_url(
+            # Pooled connections so concurrent requests don't queue on one socket
+            pool = redis.BlockingConnectionPool.from_url(
                 settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True
+                max_connections=settings.redis_pool_size,
+                health_check_interval=30
             )
+            redis_client = redis.Redis.from_pool(pool)
             # Test connection
             await redis_client.ping()
             logger.info(f"Redis connected: {settings.redis_url}")
@@ -55,6 +53,16 @@ async def lifespan(app: FastAPI):
             logger.warning(f"Failed to connect to Redis: {str(e)}. Caching disabled.")
             redis_client = None
 
+    # Initialize the process-wide YouTube client (reuses Redis for ETag caching)
+    youtube_client = YouTubeClient(
+        api_key=settings.youtube_api_key,
+        redis_client=redis_client
+    )
+    logger.info("YouTube client initialized")
+
+    # Warm up DNS, TLS and the connection pool before the first real request
+    await youtube_client.warm_up()
+
     # Initialize fetcher service
     fetcher = FetcherService(
         youtube_client=youtube_client,
@@ -81,7 +89,7 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "scheduler"):
         app.state.scheduler.shutdown()
 
-    # Close connections
+    # Close connections (the fetcher also closes the shared YouTube client)
     if hasattr(app.state, "fetcher"):
         await app.state.fetcher.close()
 
@@ -116,12 +124,19 @@ app.include_router(trending.router)
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
+    # uvloop and httptools are not available on Windows
+    use_uvloop = sys.platform != "win32"
+
     uvicorn.run(
         "app.main:app",
         host=settings.api_host,
         port=settings.api_port,
         workers=settings.api_workers,
         log_level=settings.log_level.lower(),
+        loop="uvloop" if use_uvloop else "asyncio",
+        http="httptools" if use_uvloop else "h11",
     )
@@ -2,12 +2,18 @@
 Data models for YouTube Trending Fetcher service.
 """
 from datetime import datetime
-from typing import Optional, List
+from functools import cached_property, lru_cache
+from typing import Any, Mapping, Optional, List
 from pydantic import BaseModel, Field, HttpUrl
 
 
 class VideoData(BaseModel):
-    """Model representing a single YouTube video."""
+    """
+    Model representing a single YouTube video.
+
+    Instances are frozen so the cached search_blob can't go stale; use
+    model_copy(update=...) to derive a modified video.
+    """
     video_id: str = Field(..., alias="videoId")
     title: str
     description: str
@@ -20,8 +26,25 @@ class VideoData(BaseModel):
     category_id: Optional[str] = Field(None, alias="categoryId")
     tags: Optional[List[str]] = None
 
+    @cached_property
+    def search_blob(self) -> str:
+        """Lowercased title, description and tags, joined for keyword scans."""
+        return "\x00".join([self.title, self.description, *(self.tags or [])]).lower()
+
+    def model_copy(
+        self,
+        *,
+        update: Optional[Mapping[str, Any]] = None,
+        deep: bool = False
+    ) -> "VideoData":
+        """Copy the model, dropping the cached search blob so it is rebuilt."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("search_blob", None)
+        return copied
+
     class Config:
         populate_by_name = True
+        frozen = True
         json_schema_extra = {
             "example": {
                 "videoId": "abc123xyz",
@@ -137,10 +160,17 @@ YOUTUBE_CATEGORIES = {
 }
 
 
+# Lowercased names, precomputed once in YOUTUBE_CATEGORIES order
+_CATEGORY_NAMES_LOWER = tuple(
+    (cat_id, cat_name.lower()) for cat_id, cat_name in YOUTUBE_CATEGORIES.items()
+)
+
+
+@lru_cache(maxsize=256)
 def get_category_id_by_name(category_name: str) -> Optional[str]:
     """Get category ID by name (case-insensitive partial match)."""
     category_lower = category_name.lower()
-    for cat_id, cat_name in YOUTUBE_CATEGORIES.items():
-        if category_lower in cat_name.lower():
+    for cat_id, cat_name in _CATEGORY_NAMES_LOWER:
+        if category_lower in cat_name:
             return cat_id
     return None
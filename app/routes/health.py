@@ -22,8 +22,8 @@ async def health_check(request: Request) -> HealthResponse:
     """
     fetcher = request.app.state.fetcher
 
-    # Check Redis connection
-    redis_connected = await fetcher.is_redis_connected()
+    # Check Redis connection and get last fetch timestamp in one round-trip
+    redis_connected, last_fetch = await fetcher.get_redis_health()
 
     # Check YouTube API (simple test)
     youtube_status = "unknown"
@@ -34,9 +34,6 @@ async def health_check(request: Request) -> HealthResponse:
         logger.error(f"YouTube API health check failed: {str(e)}")
         youtube_status = "error"
 
-    # Get last fetch timestamp
-    last_fetch = await fetcher.get_last_fetch_timestamp()
-
     return HealthResponse(
         status="healthy",
         timestamp=datetime.utcnow(),
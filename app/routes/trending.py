@@ -71,7 +71,7 @@ async def get_trending_videos(
         return TrendingResponse(meta=meta, data=videos)
 
     except Exception as e:
-        logger.error(f"Failed to fetch trending videos: {str(e)}", exc_info=True)
+        logger.error("Failed to fetch trending videos: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch trending videos: {str(e)}"
@@ -2,15 +2,26 @@
 YouTube Data API v3 client with retry logic and exponential backoff.
 """
 import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-
+import random
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import aiohttp
 import httpx
+import orjson
+import redis.asyncio as redis
+from httpx_aiohttp import AiohttpTransport
 from app.models import VideoData
 
 logger = logging.getLogger(__name__)
 
+_WATCH = "https://www.youtube.com/watch?v="
+
 
 class YouTubeAPIError(Exception):
     """Custom exception for YouTube API errors."""
@@ -22,9 +33,15 @@ class YouTubeClient:
     Async YouTube Data API v3 client.
 
     Implements:
-    - Exponential backoff retry logic
+    - Exponential backoff retry logic with full jitter
     - Rate limit handling (429)
     - Proper error handling and logging
+    - aiohttp-backed transport for high concurrent throughput
+    - Conditional GETs (ETag / If-None-Match) backed by Redis
+    - Bounded request concurrency
+
+    Create one instance per process and share it; each instance owns its
+    own connection pool.
     """
 
     BASE_URL = "https://www.googleapis.com/youtube/v3"
@@ -32,36 +49,326 @@ class YouTubeClient:
     INITIAL_BACKOFF = 1.0  # seconds
     MAX_BACKOFF = 60.0  # seconds
 
-    def __init__(self, api_key: str):
+    # Connection pool (all requests go to a single host)
+    MAX_CONNECTIONS = 100
+    MAX_CONNECTIONS_PER_HOST = 64
+    KEEPALIVE_EXPIRY = 75.0  # seconds
+    DNS_CACHE_TTL = 300  # seconds
+
+    # videos.list accepts at most 50 IDs per request
+    MAX_IDS_PER_REQUEST = 50
+
+    # Sent with every request; br is decoded by httpx via the brotli package
+    DEFAULT_HEADERS = {
+        "Accept-Encoding": "gzip, br",
+        "User-Agent": "yt-trending-fetcher/1.0",
+    }
+
+    # Partial responses: only the fields _parse_video_response reads
+    VIDEO_FIELDS = (
+        "items(id,snippet(title,description,publishedAt,channelTitle,channelId,"
+        "categoryId,tags,thumbnails/high/url),statistics/viewCount)"
+    )
+    SEARCH_FIELDS = "items(id/videoId)"
+
+    # Responses larger than this are parsed off the event loop thread
+    PARSE_OFFLOAD_THRESHOLD = 20
+
+    # In-process response cache for identical requests in quick succession
+    MEMO_SIZE = 256
+    MEMO_TTL = 30  # seconds
+
+    # Startup warm-up: one quick attempt, never retried
+    WARMUP_TIMEOUT = 5.0  # seconds
+
+    # Conditional request cache
+    ETAG_KEY_PREFIX = "youtube"
+    ETAG_CACHE_TTL = 3600 * 24  # 24 hours
+
+    def __init__(
+        self,
+        api_key: str,
+        redis_client: Optional[redis.Redis] = None,
+        max_concurrency: int = 64
+    ):
         """
         Initialize YouTube API client.
 
         Args:
             api_key: YouTube Data API v3 key
+            redis_client: Redis client for ETag caching (optional)
+            max_concurrency: Maximum number of in-flight API requests
         """
         if not api_key:
             raise ValueError("YouTube API key is required")
 
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.redis_client = redis_client
+        # Bounds in-flight requests to googleapis.com under burst load
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # (endpoint, params) -> (expires_at, response data), in LRU order
+        self._memo: OrderedDict[Tuple, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # (endpoint, params) -> task for the request currently in flight
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        # httpx API on top of an aiohttp connection pool; the session is
+        # created lazily on first request, inside the running event loop
+        self.client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            # Sent with every request, merged with the per-call params
+            params={"key": api_key},
+            headers=self.DEFAULT_HEADERS,
+            # Fail fast on connect; allow slow responses
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=AiohttpTransport(client=self._create_session),
+        )
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session backing the HTTP client."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.MAX_CONNECTIONS,
+                limit_per_host=self.MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+                keepalive_timeout=self.KEEPALIVE_EXPIRY,
+            )
+        )
 
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
 
+    @staticmethod
+    def _build_request_key(endpoint: str, params: Dict[str, Any]) -> Tuple:
+        """
+        Build a hashable key identifying a request.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Tuple of endpoint and sorted params
+        """
+        return endpoint, tuple(sorted(params.items()))
+
+    def _get_from_memo(self, request_key: Tuple) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a recent response from the in-process cache.
+
+        Args:
+            request_key: Key from _build_request_key
+
+        Returns:
+            Response data or None if not found or expired
+        """
+        entry = self._memo.get(request_key)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if time.monotonic() >= expires_at:
+            del self._memo[request_key]
+            return None
+
+        self._memo.move_to_end(request_key)
+        return data
+
+    def _save_to_memo(self, request_key: Tuple, data: Dict[str, Any]) -> None:
+        """
+        Save a response to the in-process cache, evicting the least recently used key.
+
+        Args:
+            request_key: Key from _build_request_key
+            data: Response data
+        """
+        self._memo[request_key] = (time.monotonic() + self.MEMO_TTL, data)
+        self._memo.move_to_end(request_key)
+        if len(self._memo) > self.MEMO_SIZE:
+            self._memo.popitem(last=False)
+
+    def _build_etag_key(self, endpoint: str, params: Dict[str, Any]) -> str:
+        """
+        Build a stable cache key for a request, ignoring the API key.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Cache key string
+        """
+        query = "&".join(
+            f"{k}={v}" for k, v in sorted(params.items()) if k != "key"
+        )
+        digest = hashlib.blake2b(
+            f"{endpoint}?{query}".encode(), digest_size=16
+        ).hexdigest()
+        return f"{self.ETAG_KEY_PREFIX}:{digest}"
+
+    async def _get_cached_response(
+        self,
+        cache_key: str
+    ) -> Tuple[Optional[str], Optional[bytes]]:
+        """
+        Get the stored ETag and response body for a request.
+
+        Args:
+            cache_key: Cache key from _build_etag_key
+
+        Returns:
+            Tuple of (etag, body), or (None, None) if either is missing
+        """
+        if self.redis_client is None:
+            return None, None
+
+        try:
+            etag, body = await self.redis_client.mget(
+                [f"{cache_key}:etag", f"{cache_key}:body"]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read ETag cache: {str(e)}")
+            return None, None
+
+        if not etag or not body:
+            return None, None
+        if isinstance(etag, bytes):
+            etag = etag.decode()
+        return etag, body
+
+    async def _save_cached_response(
+        self,
+        cache_key: str,
+        etag: str,
+        body: bytes
+    ) -> None:
+        """
+        Store the ETag and response body for a request.
+
+        Args:
+            cache_key: Cache key from _build_etag_key
+            etag: ETag response header
+            body: Raw response body
+        """
+        if self.redis_client is None:
+            return
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(f"{cache_key}:etag", self.ETAG_CACHE_TTL, etag)
+                pipe.setex(f"{cache_key}:body", self.ETAG_CACHE_TTL, body)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to save ETag cache: {str(e)}")
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header value.
+
+        Args:
+            value: Delay in seconds or an HTTP-date (optional)
+
+        Returns:
+            Delay in seconds, or None if missing or unparseable
+        """
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _get_backoff(self, retry_count: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute a full-jitter backoff delay for a retry attempt.
+
+        Args:
+            retry_count: Current retry attempt
+            retry_after: Server-requested delay in seconds (optional)
+
+        Returns:
+            Delay in seconds
+        """
+        cap = min(self.INITIAL_BACKOFF * (2 ** retry_count), self.MAX_BACKOFF)
+        backoff = random.uniform(0, cap)
+
+        # Never retry before the server asked us to; the jitter goes on top
+        if retry_after is not None:
+            backoff += retry_after
+
+        return backoff
+
     async def _make_request(
         self,
         endpoint: str,
         params: Dict[str, Any],
-        retry_count: int = 0
+        use_memo: bool = True
     ) -> Dict[str, Any]:
         """
         Make an API request with exponential backoff retry.
 
+        Successful responses are kept in memory for MEMO_TTL seconds and
+        reused for identical requests. Identical requests that arrive while
+        one is in flight wait for it instead of calling the API again.
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
-            retry_count: Current retry attempt
+            use_memo: Answer from the in-process cache when possible
+
+        Returns:
+            JSON response data
+
+        Raises:
+            YouTubeAPIError: If request fails after all retries
+        """
+        request_key = self._build_request_key(endpoint, params)
+        if use_memo:
+            data = self._get_from_memo(request_key)
+            if data is not None:
+                logger.debug(f"Using in-process cached response: {endpoint}")
+                return data
+
+        task = self._inflight.get(request_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._send_request(endpoint, params, request_key)
+            )
+            self._inflight[request_key] = task
+            task.add_done_callback(
+                lambda _: self._inflight.pop(request_key, None)
+            )
+        else:
+            logger.debug(f"Joining in-flight request: {endpoint}")
+
+        # Shielded so one cancelled caller doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _send_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        request_key: Tuple
+    ) -> Dict[str, Any]:
+        """
+        Send an API request with exponential backoff retry.
+
+        Rate limiting (429) and transport errors share one retry budget
+        of MAX_RETRIES attempts.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            request_key: Key from _build_request_key
 
         Returns:
             JSON response data
@@ -69,63 +376,87 @@ class YouTubeClient:
         Raises:
             YouTubeAPIError: If request fails after all retries
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        params["key"] = self.api_key
+        # Revalidate with the stored ETag; a 304 means the body is unchanged
+        etag_key = self._build_etag_key(endpoint, params)
+        etag, cached_body = await self._get_cached_response(etag_key)
+        headers = {"If-None-Match": etag} if etag else None
 
-        try:
-            response = await self.client.get(url, params=params)
-
-            # Handle rate limiting (429)
-            if response.status_code == 429:
-                if retry_count < self.MAX_RETRIES:
-                    backoff = min(
-                        self.INITIAL_BACKOFF * (2 ** retry_count),
-                        self.MAX_BACKOFF
-                    )
-                    logger.warning(
-                        f"Rate limited (429). Retrying in {backoff}s "
-                        f"(attempt {retry_count + 1}/{self.MAX_RETRIES})"
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with self._semaphore:
+                    response = await self.client.get(endpoint, params=params, headers=headers)
+
+                if response.status_code == 304 and cached_body is not None:
+                    logger.debug(f"Not modified, using cached response: {endpoint}")
+                    data = orjson.loads(cached_body)
+                    self._save_to_memo(request_key, data)
+                    return data
+
+                # Handle rate limiting (429)
+                if response.status_code == 429:
+                    retry_after = self._parse_retry_after(
+                        response.headers.get("Retry-After")
                     )
-                    await asyncio.sleep(backoff)
-                    return await self._make_request(endpoint, params, retry_count + 1)
-                else:
+                    # Fail fast rather than hold the request past MAX_BACKOFF
+                    if retry_after is not None and retry_after > self.MAX_BACKOFF:
+                        raise YouTubeAPIError(
+                            f"Rate limit exceeded. Server asked to retry "
+                            f"after {retry_after:.0f}s."
+                        )
+                    if attempt < self.MAX_RETRIES:
+                        backoff = self._get_backoff(attempt, retry_after)
+                        logger.warning(
+                            f"Rate limited (429). Retrying in {backoff:.2f}s "
+                            f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+                        )
+                        await asyncio.sleep(backoff)
+                        continue
                     raise YouTubeAPIError("Rate limit exceeded. Max retries reached.")
 
-            # Handle other errors
-            if response.status_code >= 400:
-                error_detail = response.json().get("error", {})
-                error_message = error_detail.get("message", "Unknown error")
-                logger.error(
-                    f"YouTube API error {response.status_code}: {error_message}"
-                )
-                raise YouTubeAPIError(
-                    f"YouTube API returned {response.status_code}: {error_message}"
-                )
+                # Handle other errors
+                if response.status_code >= 400:
+                    error_detail = orjson.loads(response.content).get("error", {})
+                    error_message = error_detail.get("message", "Unknown error")
+                    logger.error(
+                        f"YouTube API error {response.status_code}: {error_message}"
+                    )
+                    raise YouTubeAPIError(
+                        f"YouTube API returned {response.status_code}: {error_message}"
+                    )
 
-            response.raise_for_status()
-            return response.json()
+                response.raise_for_status()
+
+                response_etag = response.headers.get("ETag")
+                if response_etag:
+                    await self._save_cached_response(
+                        etag_key, response_etag, response.content
+                    )
+                data = orjson.loads(response.content)
+                self._save_to_memo(request_key, data)
+                return data
+
+            except httpx.HTTPError as e:
+                if attempt < self.MAX_RETRIES:
+                    backoff = self._get_backoff(attempt)
+                    logger.warning(
+                        f"HTTP error: {str(e)}. Retrying in {backoff:.2f}s "
+                        f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+                    )
+                    await asyncio.sleep(backoff)
+                    continue
 
-        except httpx.HTTPError as e:
-            if retry_count < self.MAX_RETRIES:
-                backoff = min(
-                    self.INITIAL_BACKOFF * (2 ** retry_count),
-                    self.MAX_BACKOFF
-                )
-                logger.warning(
-                    f"HTTP error: {str(e)}. Retrying in {backoff}s "
-                    f"(attempt {retry_count + 1}/{self.MAX_RETRIES})"
-                )
-                await asyncio.sleep(backoff)
-                return await self._make_request(endpoint, params, retry_count + 1)
-            else:
                 logger.error(f"HTTP error after {self.MAX_RETRIES} retries: {str(e)}")
                 raise YouTubeAPIError(f"HTTP request failed: {str(e)}")
 
+        # Every attempt returns, retries or raises; guard the fall-through
+        raise YouTubeAPIError(f"Request failed after {self.MAX_RETRIES} retries")
+
     async def get_trending_videos(
         self,
         region_code: str = "ID",
         category_id: Optional[str] = None,
-        max_results: int = 10
+        max_results: int = 10,
+        use_memo: bool = True
     ) -> List[VideoData]:
         """
         Fetch trending videos from YouTube.
@@ -134,6 +465,7 @@ class YouTubeClient:
             region_code: ISO 3166-1 alpha-2 country code (e.g., 'ID', 'US')
             category_id: YouTube category ID (optional)
             max_results: Maximum number of results (1-50)
+            use_memo: Reuse a recent in-process response if available
 
         Returns:
             List of VideoData objects
@@ -141,10 +473,11 @@ class YouTubeClient:
         max_results = min(max(1, max_results), 50)  # Clamp between 1 and 50
 
         params = {
-            "part": "snippet,statistics,contentDetails",
+            "part": "snippet,statistics",
             "chart": "mostPopular",
             "regionCode": region_code.upper(),
             "maxResults": max_results,
+            "fields": self.VIDEO_FIELDS,
         }
 
         if category_id:
@@ -156,8 +489,8 @@ class YouTubeClient:
         )
 
         try:
-            data = await self._make_request("videos", params)
-            videos = self._parse_video_response(data)
+            data = await self._make_request("videos", params, use_memo=use_memo)
+            videos = await self._parse_videos(data)
             logger.info(f"Successfully fetched {len(videos)} trending videos")
             return videos
 
@@ -170,7 +503,8 @@ class YouTubeClient:
         query: str,
         region_code: str = "ID",
         max_results: int = 10,
-        order: str = "viewCount"
+        order: str = "viewCount",
+        use_memo: bool = True
     ) -> List[VideoData]:
         """
         Search for videos by keyword.
@@ -180,6 +514,7 @@ class YouTubeClient:
             region_code: ISO 3166-1 alpha-2 country code
             max_results: Maximum number of results (1-50)
             order: Sort order (date, rating, relevance, title, videoCount, viewCount)
+            use_memo: Reuse recent in-process responses if available
 
         Returns:
             List of VideoData objects
@@ -194,29 +529,13 @@ class YouTubeClient:
             "regionCode": region_code.upper(),
             "maxResults": max_results,
             "order": order,
+            "fields": self.SEARCH_FIELDS,
         }
 
         logger.info(f"Searching videos: query='{query}', region={region_code}")
 
         try:
-            search_data = await self._make_request("search", search_params)
-
-            if not search_data.get("items"):
-                logger.info("No videos found for search query")
-                return []
-
-            # Extract video IDs
-            video_ids = [item["id"]["videoId"] for item in search_data["items"]]
-
-            # Fetch full video details
-            video_params = {
-                "part": "snippet,statistics,contentDetails",
-                "id": ",".join(video_ids),
-            }
-
-            video_data = await self._make_request("videos", video_params)
-            videos = self._parse_video_response(video_data)
-
+            videos = await self._search_then_hydrate(search_params, use_memo)
             logger.info(f"Successfully found {len(videos)} videos for query '{query}'")
             return videos
 
@@ -227,7 +546,8 @@ class YouTubeClient:
     async def get_channel_videos(
         self,
         channel_id: str,
-        max_results: int = 10
+        max_results: int = 10,
+        use_memo: bool = True
     ) -> List[VideoData]:
         """
         Fetch videos from a specific channel.
@@ -235,6 +555,7 @@ class YouTubeClient:
         Args:
             channel_id: YouTube channel ID
             max_results: Maximum number of results (1-50)
+            use_memo: Reuse recent in-process responses if available
 
         Returns:
             List of VideoData objects
@@ -248,29 +569,13 @@ class YouTubeClient:
             "type": "video",
             "order": "date",
             "maxResults": max_results,
+            "fields": self.SEARCH_FIELDS,
         }
 
         logger.info(f"Fetching videos from channel: {channel_id}")
 
         try:
-            search_data = await self._make_request("search", search_params)
-
-            if not search_data.get("items"):
-                logger.info(f"No videos found for channel {channel_id}")
-                return []
-
-            # Extract video IDs
-            video_ids = [item["id"]["videoId"] for item in search_data["items"]]
-
-            # Fetch full video details
-            video_params = {
-                "part": "snippet,statistics,contentDetails",
-                "id": ",".join(video_ids),
-            }
-
-            video_data = await self._make_request("videos", video_params)
-            videos = self._parse_video_response(video_data)
-
+            videos = await self._search_then_hydrate(search_params, use_memo)
             logger.info(f"Successfully fetched {len(videos)} videos from channel")
             return videos
 
@@ -278,6 +583,94 @@ class YouTubeClient:
             logger.error(f"Failed to fetch channel videos: {str(e)}")
             raise
 
+    async def _search_then_hydrate(
+        self,
+        search_params: Dict[str, Any],
+        use_memo: bool = True
+    ) -> List[VideoData]:
+        """
+        Run a search and fetch full details for the videos it returns.
+
+        Args:
+            search_params: Query parameters for the search endpoint
+            use_memo: Reuse recent in-process responses if available
+
+        Returns:
+            List of VideoData objects, empty if the search found nothing
+        """
+        search_data = await self._make_request(
+            "search", search_params, use_memo=use_memo
+        )
+
+        items = search_data.get("items")
+        if not items:
+            logger.info("No videos found for search")
+            return []
+
+        return await self._fetch_video_details(
+            [item["id"]["videoId"] for item in items], use_memo
+        )
+
+    async def _fetch_video_details(
+        self,
+        video_ids: List[str],
+        use_memo: bool = True
+    ) -> List[VideoData]:
+        """
+        Fetch full details for a list of video IDs.
+
+        IDs are split into batches of MAX_IDS_PER_REQUEST and the batches
+        are requested concurrently.
+
+        Args:
+            video_ids: YouTube video IDs
+            use_memo: Reuse recent in-process responses if available
+
+        Returns:
+            List of VideoData objects, in the order of video_ids batches
+        """
+        batches = [
+            video_ids[i:i + self.MAX_IDS_PER_REQUEST]
+            for i in range(0, len(video_ids), self.MAX_IDS_PER_REQUEST)
+        ]
+        responses = await asyncio.gather(*[
+            self._make_request(
+                "videos",
+                {
+                    "part": "snippet,statistics",
+                    "id": ",".join(batch),
+                    "fields": self.VIDEO_FIELDS,
+                },
+                use_memo=use_memo
+            )
+            for batch in batches
+        ])
+
+        videos = []
+        for data in responses:
+            videos.extend(await self._parse_videos(data))
+        return videos
+
+    async def _parse_videos(self, data: Dict[str, Any]) -> List[VideoData]:
+        """
+        Parse a YouTube API response without blocking the event loop.
+
+        Large responses are parsed in the default executor so other requests
+        keep being served meanwhile; small ones are parsed inline, where the
+        thread hand-off would cost more than the parse itself.
+
+        Args:
+            data: Raw API response
+
+        Returns:
+            List of VideoData objects
+        """
+        if len(data.get("items", [])) > self.PARSE_OFFLOAD_THRESHOLD:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._parse_video_response, data
+            )
+        return self._parse_video_response(data)
+
     def _parse_video_response(self, data: Dict[str, Any]) -> List[VideoData]:
         """
         Parse YouTube API response into VideoData objects.
@@ -288,29 +681,32 @@ class YouTubeClient:
         Returns:
             List of VideoData objects
         """
-        videos = []
+        videos: List[VideoData] = []
+        # Bind hot lookups to locals once instead of per item
+        append = videos.append
+        validate = VideoData.model_validate
+        fromisoformat = datetime.fromisoformat
 
         for item in data.get("items", []):
             try:
+                video_id = item["id"]
                 snippet = item.get("snippet", {})
-                statistics = item.get("statistics", {})
-
-                video = VideoData(
-                    videoId=item["id"],
-                    title=snippet.get("title", ""),
-                    description=snippet.get("description", "")[:500],  # Truncate
-                    viewCount=int(statistics.get("viewCount", 0)),
-                    publishedAt=datetime.fromisoformat(
-                        snippet.get("publishedAt", "").replace("Z", "+00:00")
-                    ),
-                    channelTitle=snippet.get("channelTitle", ""),
-                    channelId=snippet.get("channelId", ""),
-                    videoLink=f"https://www.youtube.com/watch?v={item['id']}",
-                    thumbnailUrl=snippet.get("thumbnails", {}).get("high", {}).get("url"),
-                    categoryId=snippet.get("categoryId"),
-                    tags=snippet.get("tags", [])[:10]  # Limit tags
-                )
-                videos.append(video)
+                get = snippet.get
+
+                append(validate({
+                    "videoId": video_id,
+                    "title": get("title", ""),
+                    "description": get("description", "")[:500],  # Truncate
+                    "viewCount": int(item.get("statistics", {}).get("viewCount", 0)),
+                    # Python 3.11+ parses the trailing "Z" natively
+                    "publishedAt": fromisoformat(get("publishedAt", "")),
+                    "channelTitle": get("channelTitle", ""),
+                    "channelId": get("channelId", ""),
+                    "videoLink": _WATCH + video_id,
+                    "thumbnailUrl": get("thumbnails", {}).get("high", {}).get("url"),
+                    "categoryId": get("categoryId"),
+                    "tags": get("tags", [])[:10],  # Limit tags
+                }))
 
             except (KeyError, ValueError) as e:
                 logger.warning(f"Failed to parse video item: {str(e)}")
@@ -318,10 +714,33 @@ class YouTubeClient:
 
         return videos
 
+    async def warm_up(self) -> bool:
+        """
+        Open a pooled connection to the API host ahead of the first request.
+
+        Makes a single request with a short timeout and no retries. It
+        targets the API root rather than a quota-counted method, and any
+        HTTP response counts as success: only DNS, TLS and the connection
+        matter here.
+
+        Returns:
+            True if the host answered, False otherwise
+        """
+        try:
+            await self.client.get("", timeout=self.WARMUP_TIMEOUT)
+            logger.info("YouTube API connection warmed up")
+            return True
+
+        except httpx.HTTPError as e:
+            logger.warning(f"YouTube API warm-up failed: {str(e)}")
+            return False
+
     async def test_connection(self) -> bool:
         """
         Test YouTube API connection and credentials.
 
+        Always calls the API; a memoized response would hide an outage.
+
         Returns:
             True if connection is successful, False otherwise
         """
@@ -332,7 +751,7 @@ class YouTubeClient:
                 "regionCode": "US",
                 "maxResults": 1,
             }
-            await self._make_request("videos", params)
+            await self._make_request("videos", params, use_memo=False)
             logger.info("YouTube API connection test successful")
             return True
 
@@ -78,6 +78,14 @@ def mock_redis_client():
     redis.set = AsyncMock()
     redis.ping = AsyncMock()
     redis.aclose = AsyncMock()
+
+    # Pipelines queue commands synchronously and flush on execute()
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.setex = MagicMock()
+    pipe.set = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
     return redis
 
 
@@ -1,9 +1,11 @@
 """
 Tests for fetcher service.
 """
+import asyncio
 import json
 import pytest
 from datetime import datetime
+from unittest.mock import AsyncMock
 
 from app.models import VideoData
 
@@ -26,7 +28,7 @@ async def test_fetch_trending_with_cache(fetcher_service, mock_video_data, mock_
     """Test fetching trending videos from cache."""
     # Set up cache hit
     cached_data = json.dumps([mock_video_data.model_dump(by_alias=True)], default=str)
-    mock_redis_client.get = pytest.AsyncMock(return_value=cached_data)
+    mock_redis_client.get = AsyncMock(return_value=cached_data)
 
     videos, from_cache = await fetcher_service.fetch_trending(
         country="ID",
@@ -87,6 +89,11 @@ async def test_cache_key_building(fetcher_service):
     assert "lofi" in key2
     assert key1 != key2
 
+    key3 = fetcher_service._build_cache_key(
+        "ID", category="music", keyword="lofi", channel_id="UC1", date_str="2025-11-10"
+    )
+    assert key3 == "trending:ID:2025-11-10:cat_music:kw_lofi:ch_UC1"
+
 
 @pytest.mark.asyncio
 async def test_redis_connection_check(fetcher_service):
@@ -105,3 +112,195 @@ async def test_filter_by_keyword(fetcher_service, mock_video_data):
 
     filtered_empty = fetcher_service._filter_by_keyword(videos, "nonexistent")
     assert len(filtered_empty) == 0
+
+    # Case-insensitive, matches tags, and treats keywords literally
+    assert len(fetcher_service._filter_by_keyword(videos, "VIDEO TITLE")) == 1
+    assert len(fetcher_service._filter_by_keyword(videos, "vid")) == 1
+    assert len(fetcher_service._filter_by_keyword(videos, "t.st")) == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_cache_default_categories(
+    fetcher_service, mock_youtube_client, mock_redis_client
+):
+    """Test scheduled fetch runs categories concurrently and pipelines writes."""
+    await fetcher_service.fetch_and_cache_default_categories(
+        country="ID",
+        categories=["music", "news"],
+        limit=5
+    )
+
+    pipe = mock_redis_client.pipeline.return_value
+    assert mock_youtube_client.get_trending_videos.await_count == 2
+    for call in mock_youtube_client.get_trending_videos.await_args_list:
+        assert call.kwargs["use_memo"] is False
+    assert pipe.setex.call_count == 2
+    pipe.set.assert_called_once()
+    pipe.execute.assert_awaited_once()
+    mock_redis_client.setex.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_cache_default_categories_skips_cancelled(
+    fetcher_service, mock_youtube_client, mock_video_data
+):
+    """Test a cancelled category fetch is skipped, not cached as videos."""
+    mock_youtube_client.get_trending_videos = AsyncMock(
+        side_effect=[[mock_video_data], asyncio.CancelledError()]
+    )
+
+    fetcher_service._save_fetch_results = AsyncMock(return_value=True)
+
+    await fetcher_service.fetch_and_cache_default_categories(
+        country="ID",
+        categories=["music", "news"],
+        limit=5
+    )
+
+    fetcher_service._save_fetch_results.assert_awaited_once_with(
+        [(fetcher_service._build_cache_key("ID", "music"), [mock_video_data])]
+    )
+
+
+@pytest.mark.asyncio
+async def test_last_fetch_timestamp(fetcher_service, mock_redis_client):
+    """Test last fetch timestamp is stored as epoch ns and read back as UTC."""
+    await fetcher_service._update_last_fetch_timestamp()
+    stored = mock_redis_client.set.await_args.args[1]
+    assert isinstance(stored, int)
+
+    mock_redis_client.get = AsyncMock(return_value=str(stored).encode())
+    last_fetch = await fetcher_service.get_last_fetch_timestamp()
+    assert last_fetch.tzinfo is not None
+    assert abs(last_fetch.timestamp() - stored / 1e9) < 1e-3
+
+    # Legacy ISO-formatted values are still readable
+    mock_redis_client.get = AsyncMock(return_value="2025-11-10T12:00:00")
+    assert await fetcher_service.get_last_fetch_timestamp() == datetime(2025, 11, 10, 12)
+
+
+@pytest.mark.asyncio
+async def test_fetch_trending_pipelines_cache_writes(fetcher_service, mock_redis_client):
+    """Test a cache miss writes videos and last fetch timestamp in one pipeline."""
+    await fetcher_service.fetch_trending(country="ID", limit=10)
+
+    pipe = mock_redis_client.pipeline.return_value
+    pipe.setex.assert_called_once()
+    pipe.set.assert_called_once()
+    pipe.execute.assert_awaited_once()
+    mock_redis_client.setex.assert_not_awaited()
+    mock_redis_client.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_redis_health_bundle(fetcher_service, mock_redis_client):
+    """Test Redis health check pipelines PING with the last fetch GET."""
+    pipe = mock_redis_client.pipeline.return_value
+    pipe.execute = AsyncMock(return_value=[True, b"1762776000000000000"])
+
+    connected, last_fetch = await fetcher_service.get_redis_health()
+
+    assert connected is True
+    assert last_fetch.year == 2025
+    pipe.ping.assert_called_once()
+    pipe.get.assert_called_once_with(fetcher_service.LAST_FETCH_KEY)
+    pipe.execute.assert_awaited_once()
+
+    pipe.execute = AsyncMock(side_effect=ConnectionError("down"))
+    assert await fetcher_service.get_redis_health() == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_cache_payload_roundtrip(fetcher_service, mock_video_data, mock_redis_client):
+    """Test cached payloads are compressed on write and decoded on read."""
+    await fetcher_service._save_to_cache("trending:test", [mock_video_data])
+    payload = mock_redis_client.setex.await_args.args[2]
+    assert payload[:4] == b"\x28\xb5\x2f\xfd"
+
+    mock_redis_client.get = AsyncMock(return_value=payload)
+    videos = await fetcher_service._get_from_cache("trending:test")
+    assert videos == [mock_video_data]
+
+
+@pytest.mark.asyncio
+async def test_memory_cache(fetcher_service, mock_video_data, mock_redis_client):
+    """Test repeat lookups are served in-process without hitting Redis."""
+    fetcher_service.MEMORY_CACHE_SIZE = 2
+
+    await fetcher_service._save_to_cache("trending:a", [mock_video_data])
+    mock_redis_client.get = AsyncMock(return_value=None)
+
+    assert await fetcher_service._get_from_cache("trending:a") == [mock_video_data]
+    mock_redis_client.get.assert_not_awaited()
+
+    # Least recently used key is evicted once the cache is full
+    fetcher_service._save_to_memory("trending:b", [mock_video_data])
+    fetcher_service._save_to_memory("trending:c", [mock_video_data])
+    assert fetcher_service._get_from_memory("trending:a") is None
+
+    # Expired entries are dropped
+    fetcher_service.MEMORY_CACHE_TTL = -1
+    fetcher_service._save_to_memory("trending:d", [mock_video_data])
+    assert fetcher_service._get_from_memory("trending:d") is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_trending_many(
+    fetcher_service, mock_video_data, mock_youtube_client, mock_redis_client
+):
+    """Test multi-category fetch reads cache with one MGET and fetches misses."""
+    await fetcher_service._save_to_cache("trending:seed", [mock_video_data])
+    payload = mock_redis_client.setex.await_args.args[2]
+    fetcher_service._memory_cache.clear()
+    mock_redis_client.mget = AsyncMock(return_value=[payload, None])
+
+    results = await fetcher_service.fetch_trending_many(
+        country="id",
+        categories=["music", "news"],
+        limit=5
+    )
+
+    mock_redis_client.mget.assert_awaited_once()
+    assert results["music"] == ([mock_video_data], True)
+    assert results["news"] == ([mock_video_data], False)
+    mock_youtube_client.get_trending_videos.assert_awaited_once()
+    mock_redis_client.pipeline.return_value.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_trending_many_skips_cancelled(
+    fetcher_service, mock_video_data, mock_youtube_client, mock_redis_client
+):
+    """Test a cancelled category fetch is left out instead of raising."""
+    mock_redis_client.mget = AsyncMock(return_value=[None, None])
+    mock_youtube_client.get_trending_videos = AsyncMock(
+        side_effect=[[mock_video_data], asyncio.CancelledError()]
+    )
+
+    results = await fetcher_service.fetch_trending_many(
+        country="ID",
+        categories=["music", "news"],
+        limit=5
+    )
+
+    assert results == {"music": ([mock_video_data], False)}
+
+
+@pytest.mark.asyncio
+async def test_save_fetch_results_fills_memory_only_after_execute(
+    fetcher_service, mock_video_data, mock_redis_client
+):
+    """Test pipelined writes reach the memory cache only once Redis has them."""
+    pipe = mock_redis_client.pipeline.return_value
+    pipe.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+
+    assert await fetcher_service._save_fetch_results(
+        [("trending:failed", [mock_video_data])]
+    ) is False
+    assert fetcher_service._get_from_memory("trending:failed") is None
+
+    pipe.execute = AsyncMock(return_value=[])
+    assert await fetcher_service._save_fetch_results(
+        [("trending:saved", [mock_video_data])]
+    ) is True
+    assert fetcher_service._get_from_memory("trending:saved") == [mock_video_data]
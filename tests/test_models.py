@@ -3,6 +3,7 @@ Tests for data models.
 """
 from datetime import datetime
 import pytest
+from pydantic import ValidationError
 
 from app.models import VideoData, MetaData, TrendingResponse, get_category_id_by_name
 
@@ -92,3 +93,55 @@ def test_get_category_id_by_name():
 
     # Test not found
     assert get_category_id_by_name("nonexistent") is None
+
+
+def test_get_category_id_by_name_prefers_first_match():
+    """Test the first substring match wins over a later exact name match."""
+    # "Science & Technology" (28) precedes the exact "Tech" (44)
+    assert get_category_id_by_name("tech") == "28"
+    # "Short Movies" (18) precedes the exact "Movies" (30)
+    assert get_category_id_by_name("movies") == "18"
+
+
+def test_video_data_search_blob():
+    """Test VideoData search blob is lowercased and excluded from dumps."""
+    video = VideoData(
+        videoId="abc123",
+        title="Lofi BEATS",
+        description="Chill",
+        viewCount=100,
+        publishedAt=datetime.now(),
+        channelTitle="Test",
+        channelId="UC123",
+        videoLink="https://test.com",
+        tags=["Study"]
+    )
+
+    assert "lofi beats" in video.search_blob
+    assert "study" in video.search_blob
+    # Fields are separated so matches cannot span title and description
+    assert "beatschill" not in video.search_blob
+    assert "searchBlob" not in video.model_dump(by_alias=True)
+    assert "search_blob" not in video.model_dump()
+
+
+def test_video_data_search_blob_never_stale():
+    """Test videos are immutable and copies rebuild their search blob."""
+    video = VideoData(
+        videoId="abc123",
+        title="Old Title",
+        description="Chill",
+        viewCount=100,
+        publishedAt=datetime.now(),
+        channelTitle="Test",
+        channelId="UC123",
+        videoLink="https://test.com"
+    )
+    assert "old title" in video.search_blob
+
+    with pytest.raises(ValidationError):
+        video.title = "New Title"
+
+    copied = video.model_copy(update={"title": "New Title"})
+    assert "new title" in copied.search_blob
+    assert "old title" not in copied.search_blob
@@ -5,13 +5,32 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock
 
+from app.config import settings
 from app.main import app
 from app.fetcher import FetcherService
+from app.youtube_client import YouTubeClient
 
 
-@pytest.fixture
-def mock_fetcher_in_app(mock_youtube_client, mock_redis_client, mock_video_data):
-    """Mock fetcher service and inject into app state."""
+@pytest.fixture(scope="module")
+def client():
+    """
+    Test client shared by the whole module.
+
+    The app lifespan (Redis connect, YouTube warm-up, scheduler) runs once
+    per module instead of once per test.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        # Keep startup off the network: no Redis, no YouTube warm-up call
+        mp.setattr(settings, "youtube_api_key", "test-key")
+        mp.setattr(settings, "redis_enabled", False)
+        mp.setattr(YouTubeClient, "warm_up", AsyncMock(return_value=True))
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest.fixture(autouse=True)
+def mock_fetcher_in_app(client, mock_youtube_client, mock_redis_client, mock_video_data):
+    """Inject a fresh mocked fetcher service into app state for each test."""
     fetcher = FetcherService(
         youtube_client=mock_youtube_client,
         redis_client=mock_redis_client
@@ -24,16 +43,14 @@ def mock_fetcher_in_app(mock_youtube_client, mock_redis_client, mock_video_data)
     fetcher.fetch_trending = mock_fetch_trending
     fetcher.is_redis_connected = AsyncMock(return_value=True)
     fetcher.get_last_fetch_timestamp = AsyncMock(return_value=None)
+    fetcher.get_redis_health = AsyncMock(return_value=(True, None))
 
+    # Set after startup so the lifespan doesn't replace it; restore the
+    # real service so shutdown closes its connections
+    original = app.state.fetcher
     app.state.fetcher = fetcher
-    return fetcher
-
-
-@pytest.fixture
-def client(mock_fetcher_in_app):
-    """Test client with mocked dependencies."""
-    with TestClient(app) as test_client:
-        yield test_client
+    yield fetcher
+    app.state.fetcher = original
 
 
 def test_root_endpoint(client):
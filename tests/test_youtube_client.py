@@ -0,0 +1,412 @@
+"""
+Tests for YouTube API client.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import brotli
+import httpx
+import pytest
+
+from app.youtube_client import YouTubeClient, YouTubeAPIError
+
+
+def _mock_http_client(handler):
+    """HTTP client configured like YouTubeClient's, backed by handler."""
+    return httpx.AsyncClient(
+        base_url=YouTubeClient.BASE_URL,
+        params={"key": "test-key"},
+        headers=YouTubeClient.DEFAULT_HEADERS,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+@pytest.fixture
+async def youtube_client():
+    """YouTube client with a dummy API key."""
+    client = YouTubeClient(api_key="test-key")
+    yield client
+    await client.close()
+
+
+def test_backoff_full_jitter(youtube_client):
+    """Test backoff is randomized between zero and the exponential cap."""
+    delays = [youtube_client._get_backoff(2) for _ in range(100)]
+
+    assert all(0 <= d <= youtube_client.INITIAL_BACKOFF * 4 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_backoff_honors_retry_after(youtube_client):
+    """Test Retry-After is treated as a minimum delay, never shortened."""
+    assert 5 <= youtube_client._get_backoff(0, 5.0) <= 5 + youtube_client.INITIAL_BACKOFF
+    assert youtube_client._get_backoff(3, 60.0) >= 60
+    assert youtube_client._get_backoff(0, None) <= youtube_client.INITIAL_BACKOFF
+
+
+def test_parse_retry_after(youtube_client):
+    """Test Retry-After accepts delta-seconds and HTTP-dates."""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert youtube_client._parse_retry_after("5") == 5.0
+    assert 25 < youtube_client._parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+    assert youtube_client._parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT") == 0.0
+    assert youtube_client._parse_retry_after("not-a-date") is None
+    assert youtube_client._parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_make_request_fails_fast_on_long_retry_after(youtube_client, monkeypatch):
+    """Test a Retry-After beyond MAX_BACKOFF raises instead of retrying early."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "120"})
+
+    youtube_client.client = _mock_http_client(handler)
+    sleep = AsyncMock()
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    with pytest.raises(YouTubeAPIError, match="retry after 120s"):
+        await youtube_client._make_request("videos", {"part": "snippet"})
+
+    assert len(calls) == 1
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_make_request_retries_iteratively(youtube_client, monkeypatch):
+    """Test 429s are retried in a loop and succeed within the retry budget."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(429)
+        return httpx.Response(200, json={"items": []})
+
+    youtube_client.client = _mock_http_client(handler)
+    monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+
+    data = await youtube_client._make_request("videos", {"part": "snippet"})
+
+    assert data == {"items": []}
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_make_request_exhausts_retries(youtube_client, monkeypatch):
+    """Test 429s and network errors share one retry budget."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) % 2:
+            return httpx.Response(429)
+        raise httpx.ConnectError("boom", request=request)
+
+    youtube_client.client = _mock_http_client(handler)
+    monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+
+    with pytest.raises(YouTubeAPIError):
+        await youtube_client._make_request("videos", {"part": "snippet"})
+
+    assert len(calls) == youtube_client.MAX_RETRIES + 1
+
+
+@pytest.mark.asyncio
+async def test_make_request_conditional_get(youtube_client, mock_redis_client):
+    """Test ETags are stored on 200 and revalidated with If-None-Match."""
+    seen_etags = []
+
+    def handler(request):
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"items": ["fresh"]}, headers={"ETag": '"v1"'})
+
+    youtube_client.client = _mock_http_client(handler)
+    youtube_client.redis_client = mock_redis_client
+    mock_redis_client.mget = AsyncMock(return_value=[None, None])
+    pipe = mock_redis_client.pipeline.return_value
+
+    assert await youtube_client._make_request("videos", {"part": "snippet"}) == {
+        "items": ["fresh"]
+    }
+    assert pipe.setex.call_count == 2
+    pipe.execute.assert_awaited_once()
+
+    # Expire the in-process copy so the second call revalidates
+    youtube_client._memo.clear()
+    mock_redis_client.mget = AsyncMock(return_value=[b'"v1"', b'{"items": ["cached"]}'])
+    assert await youtube_client._make_request("videos", {"part": "snippet"}) == {
+        "items": ["cached"]
+    }
+    assert seen_etags == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_make_request_memoizes_recent_responses(youtube_client, monkeypatch):
+    """Test identical requests within MEMO_TTL are answered from memory."""
+    calls = []
+    now = [1000.0]
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"items": [len(calls)]})
+
+    youtube_client.client = _mock_http_client(handler)
+    monkeypatch.setattr("app.youtube_client.time.monotonic", lambda: now[0])
+
+    first = await youtube_client._make_request("videos", {"part": "snippet", "id": "a"})
+    second = await youtube_client._make_request("videos", {"id": "a", "part": "snippet"})
+    await youtube_client._make_request("videos", {"part": "snippet", "id": "b"})
+
+    assert first == second == {"items": [1]}
+    assert len(calls) == 2
+
+    now[0] += youtube_client.MEMO_TTL
+    assert await youtube_client._make_request(
+        "videos", {"part": "snippet", "id": "a"}
+    ) == {"items": [3]}
+
+
+@pytest.mark.asyncio
+async def test_connection_probe_skips_memo(youtube_client, monkeypatch):
+    """Test test_connection reports an outage instead of a memoized success."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(200, json={"items": []})
+        raise httpx.ConnectError("down")
+
+    youtube_client.client = _mock_http_client(handler)
+    monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+
+    assert await youtube_client.test_connection() is True
+    assert await youtube_client.test_connection() is False
+    assert len(calls) == 1 + youtube_client.MAX_RETRIES + 1
+
+
+@pytest.mark.asyncio
+async def test_warm_up_is_a_single_attempt(youtube_client):
+    """Test warm-up makes one short request and never retries."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("down")
+
+    youtube_client.client = _mock_http_client(handler)
+
+    assert await youtube_client.warm_up() is False
+    assert len(calls) == 1
+    assert calls[0].extensions["timeout"]["read"] == youtube_client.WARMUP_TIMEOUT
+
+    youtube_client.client = _mock_http_client(lambda request: httpx.Response(404))
+    assert await youtube_client.warm_up() is True
+
+
+@pytest.mark.asyncio
+async def test_make_request_coalesces_concurrent_calls(youtube_client):
+    """Test identical concurrent requests share a single upstream call."""
+    calls = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        calls.append(request)
+        await release.wait()
+        return httpx.Response(200, json={"items": ["shared"]})
+
+    youtube_client.client = _mock_http_client(handler)
+
+    waiters = [
+        asyncio.create_task(youtube_client._make_request("videos", {"id": "a"}))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert len(calls) == 1
+    assert all(result == {"items": ["shared"]} for result in results)
+    assert youtube_client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_make_request_does_not_mutate_params(youtube_client):
+    """Test the API key comes from the client defaults, not the caller's params."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"items": []})
+
+    assert youtube_client.client.base_url == YouTubeClient.BASE_URL + "/"
+    assert youtube_client.client.params["key"] == "test-key"
+
+    youtube_client.client = _mock_http_client(handler)
+    params = {"part": "snippet"}
+    await youtube_client._make_request("videos", params)
+
+    assert params == {"part": "snippet"}
+    assert str(requests[0].url.copy_with(query=None)) == f"{YouTubeClient.BASE_URL}/videos"
+    assert requests[0].url.params["key"] == "test-key"
+    assert requests[0].url.params["part"] == "snippet"
+
+
+@pytest.mark.asyncio
+async def test_make_request_negotiates_compression(youtube_client):
+    """Test gzip/br is advertised and brotli-encoded bodies are decoded."""
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers)
+        return httpx.Response(
+            200,
+            content=brotli.compress(b'{"items": ["compressed"]}'),
+            headers={"Content-Encoding": "br"},
+        )
+
+    assert youtube_client.client.headers["Accept-Encoding"] == "gzip, br"
+
+    youtube_client.client = _mock_http_client(handler)
+    data = await youtube_client._make_request("videos", {"part": "snippet"})
+
+    assert data == {"items": ["compressed"]}
+    assert seen_headers[0]["Accept-Encoding"] == "gzip, br"
+    assert seen_headers[0]["User-Agent"] == "yt-trending-fetcher/1.0"
+
+
+def test_etag_key_ignores_api_key_and_param_order(youtube_client):
+    """Test ETag cache keys are stable across param order and API keys."""
+    key1 = youtube_client._build_etag_key("videos", {"a": 1, "b": 2, "key": "x"})
+    key2 = youtube_client._build_etag_key("videos", {"b": 2, "a": 1, "key": "y"})
+    key3 = youtube_client._build_etag_key("search", {"a": 1, "b": 2})
+
+    assert key1 == key2
+    assert key1 != key3
+
+
+@pytest.mark.asyncio
+async def test_search_videos_requests_partial_responses(youtube_client, mock_youtube_response):
+    """Test search and hydrate calls ask only for the fields that are parsed."""
+    fields = {}
+
+    def handler(request):
+        endpoint = request.url.path.rsplit("/", 1)[-1]
+        fields[endpoint] = request.url.params.get("fields")
+        if endpoint == "search":
+            return httpx.Response(200, json={"items": [{"id": {"videoId": "test123"}}]})
+        return httpx.Response(200, json=mock_youtube_response)
+
+    youtube_client.client = _mock_http_client(handler)
+
+    videos = await youtube_client.search_videos("test")
+
+    assert fields == {
+        "search": YouTubeClient.SEARCH_FIELDS,
+        "videos": YouTubeClient.VIDEO_FIELDS,
+    }
+    assert videos[0].video_id == "test123"
+
+
+@pytest.mark.asyncio
+async def test_search_then_hydrate_skips_empty_search(youtube_client):
+    """Test an empty search returns no videos without a hydrate request."""
+    endpoints = []
+
+    def handler(request):
+        endpoints.append(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(200, json={"items": []})
+
+    youtube_client.client = _mock_http_client(handler)
+
+    videos = await youtube_client.get_channel_videos("UC123")
+
+    assert videos == []
+    assert endpoints == ["search"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_video_details_batches_ids(youtube_client, mock_youtube_response):
+    """Test video IDs are hydrated in concurrent batches of at most 50."""
+    batches = []
+
+    def handler(request):
+        batches.append(request.url.params["id"].split(","))
+        return httpx.Response(200, json=mock_youtube_response)
+
+    youtube_client.client = _mock_http_client(handler)
+
+    videos = await youtube_client._fetch_video_details([f"id{i}" for i in range(120)])
+
+    assert sorted(len(batch) for batch in batches) == [20, 50, 50]
+    assert len(videos) == 3
+    assert videos[0].video_id == "test123"
+
+
+@pytest.mark.asyncio
+async def test_make_request_bounds_concurrency():
+    """Test concurrent requests never exceed max_concurrency in flight."""
+    client = YouTubeClient(api_key="test-key", max_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"items": []})
+
+    client.client = _mock_http_client(handler)
+
+    await asyncio.gather(*[
+        client._make_request("videos", {"id": str(i)}) for i in range(6)
+    ])
+    await client.close()
+
+    assert peak == 2
+
+
+def test_parse_video_response(youtube_client, mock_youtube_response):
+    """Test API items are parsed into VideoData with UTC publish times."""
+    videos = youtube_client._parse_video_response(mock_youtube_response)
+
+    assert len(videos) == 1
+    video = videos[0]
+    assert video.video_id == "test123"
+    assert video.view_count == 1000000
+    assert video.published_at == datetime(2025, 11, 10, 12, 0, 0, tzinfo=timezone.utc)
+    assert video.video_link == "https://www.youtube.com/watch?v=test123"
+    assert video.thumbnail_url == "https://i.ytimg.com/vi/test123/default.jpg"
+    assert video.tags == ["test", "video"]
+
+
+@pytest.mark.asyncio
+async def test_parse_videos_offloads_large_responses(youtube_client, mock_youtube_response):
+    """Test large responses are parsed in the executor and small ones inline."""
+    item = mock_youtube_response["items"][0]
+    large = {"items": [item] * (youtube_client.PARSE_OFFLOAD_THRESHOLD + 1)}
+    loop = asyncio.get_running_loop()
+    original = loop.run_in_executor
+    loop.run_in_executor = MagicMock(side_effect=original)
+
+    try:
+        small_videos = await youtube_client._parse_videos(mock_youtube_response)
+        loop.run_in_executor.assert_not_called()
+
+        large_videos = await youtube_client._parse_videos(large)
+        loop.run_in_executor.assert_called_once()
+    finally:
+        loop.run_in_executor = original
+
+    assert len(small_videos) == 1
+    assert len(large_videos) == youtube_client.PARSE_OFFLOAD_THRESHOLD + 1